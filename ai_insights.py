@@ -9,30 +9,52 @@ Author: DEADLINEAI Team
 Date: 2025-12-24
 """
 
-import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
+from dataclasses import dataclass, field, asdict
+from enum import IntEnum
+from functools import cached_property
 
+import numpy as np
+import orjson
 
-class PriorityLevel(Enum):
-    """Priority levels for assignments."""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
 
+class PriorityLevel(IntEnum):
+    """Priority levels for assignments, from most to least urgent."""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
 
-class DifficultyLevel(Enum):
-    """Difficulty levels for assignments."""
-    BEGINNER = "beginner"
-    INTERMEDIATE = "intermediate"
-    ADVANCED = "advanced"
-    EXPERT = "expert"
+    @property
+    def label(self) -> str:
+        """Lower-case name used in serialized output."""
+        return self.name.lower()
 
 
-@dataclass
+class DifficultyLevel(IntEnum):
+    """Difficulty levels for assignments, from easiest to hardest."""
+    BEGINNER = 0
+    INTERMEDIATE = 1
+    ADVANCED = 2
+    EXPERT = 3
+
+    @property
+    def label(self) -> str:
+        """Lower-case name used in serialized output."""
+        return self.name.lower()
+
+
+# Weights indexed by level value; the arrays back the vectorized code paths.
+_PRIORITY_WEIGHTS = (30.0, 20.0, 10.0, 0.0)
+_PRIORITY_WEIGHT_ARRAY = np.array(_PRIORITY_WEIGHTS)
+_HIGH_PRIORITY_CODES = np.array([PriorityLevel.CRITICAL, PriorityLevel.HIGH], dtype=np.int8)
+
+_DIFFICULTY_WEIGHTS = (1.0, 2.0, 3.0, 4.0)
+_DIFFICULTY_WEIGHT_ARRAY = np.array(_DIFFICULTY_WEIGHTS)
+
+
+@dataclass(slots=True)
 class Assignment:
     """Represents an assignment with its metadata."""
     id: str
@@ -45,10 +67,10 @@ class Assignment:
     priority: PriorityLevel
     completed: bool = False
     progress: float = 0.0
-    dependencies: List[str] = None
+    dependencies: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class InsightMetric:
     """Represents a single insight metric."""
     name: str
@@ -57,8 +79,44 @@ class InsightMetric:
     interpretation: str = ""
 
 
+def _urgency_scores(
+    hours_remaining: np.ndarray,
+    estimated_hours: np.ndarray,
+    priority_weights: np.ndarray,
+    completed: np.ndarray
+) -> np.ndarray:
+    """
+    Compute urgency scores (0-100) for parallel arrays of assignment fields.
+
+    Args:
+        hours_remaining: Hours until each deadline (negative when overdue).
+        estimated_hours: Estimated hours of work per assignment.
+        priority_weights: Urgency weight of each assignment's priority.
+        completed: Completion flag per assignment.
+
+    Returns:
+        Array of urgency scores aligned with the inputs.
+    """
+    # Work in a single output buffer to avoid allocating a temporary per operation
+    urgency = np.maximum(hours_remaining, 1.0)
+    np.divide(estimated_hours, urgency, out=urgency)
+    urgency *= 50
+    due_soon = hours_remaining < 24
+    urgency[due_soon] += (100 - hours_remaining[due_soon]) / 10
+    urgency += priority_weights
+    np.minimum(urgency, 100.0, out=urgency)
+    urgency[hours_remaining <= 0] = 100.0
+    urgency[completed] = 0.0
+    return urgency
+
+
 class AssignmentInsights:
-    """Generates AI-powered insights for assignments."""
+    """
+    Generates AI-powered insights for assignments.
+
+    Aggregates are computed at most once per instance; create a new
+    instance when the list of assignments changes.
+    """
 
     def __init__(self, assignments: List[Assignment]):
         """
@@ -70,6 +128,23 @@ class AssignmentInsights:
         self.assignments = assignments
         self.current_time = datetime.utcnow()
 
+        # Column-wise view of the assignments so that scoring and workload
+        # analysis run as vectorized array expressions.
+        count = len(assignments)
+        self._deadlines = np.array([a.deadline for a in assignments], dtype='datetime64[us]')
+        self._hours = np.fromiter((a.estimated_hours for a in assignments), np.float64, count)
+        self._priority_codes = np.fromiter((a.priority for a in assignments), np.int8, count)
+        self._difficulty_codes = np.fromiter((a.difficulty for a in assignments), np.int8, count)
+        self._completed = np.fromiter((a.completed for a in assignments), np.bool_, count)
+        self._progress = np.fromiter((a.progress for a in assignments), np.float32, count)
+        self._hours_remaining = (
+            self._deadlines - np.datetime64(self.current_time, 'us')
+        ) / np.timedelta64(1, 'h')
+        self._urgency = self.calculate_urgency_scores()
+        self._incomplete = np.flatnonzero(~self._completed)
+        self._completed_count = count - self._incomplete.size
+        self._positions = {id(a): i for i, a in enumerate(assignments)}
+
     def calculate_urgency_score(self, assignment: Assignment) -> float:
         """
         Calculate urgency score for an assignment (0-100).
@@ -80,20 +155,32 @@ class AssignmentInsights:
         Returns:
             Urgency score from 0 (not urgent) to 100 (extremely urgent).
         """
-        if assignment.completed:
-            return 0.0
+        position = self._positions.get(id(assignment))
+        if position is not None:
+            return float(self._urgency[position])
 
         time_remaining = (assignment.deadline - self.current_time).total_seconds() / 3600
-        estimated_hours = assignment.estimated_hours
-
-        if time_remaining <= 0:
-            return 100.0
-
-        urgency = (estimated_hours / max(time_remaining, 1)) * 50
-        urgency += (100 - time_remaining) / 10 if time_remaining < 24 else 0
-        urgency += self._priority_weight(assignment.priority)
+        urgency = _urgency_scores(
+            np.array([time_remaining]),
+            np.array([assignment.estimated_hours], dtype=np.float64),
+            np.array([self._priority_weight(assignment.priority)]),
+            np.array([assignment.completed])
+        )
+        return float(urgency[0])
+
+    def calculate_urgency_scores(self) -> np.ndarray:
+        """
+        Calculate urgency scores for all assignments at once.
 
-        return min(urgency, 100.0)
+        Returns:
+            Array of urgency scores aligned with ``self.assignments``.
+        """
+        return _urgency_scores(
+            self._hours_remaining,
+            self._hours,
+            _PRIORITY_WEIGHT_ARRAY[self._priority_codes],
+            self._completed
+        )
 
     def calculate_workload_distribution(self) -> Dict[str, float]:
         """
@@ -102,30 +189,22 @@ class AssignmentInsights:
         Returns:
             Dictionary with workload distribution insights.
         """
-        distribution = {
-            "today": 0.0,
-            "this_week": 0.0,
-            "this_month": 0.0,
-            "overdue": 0.0
-        }
-
-        for assignment in self.assignments:
-            if assignment.completed:
-                continue
-
-            time_diff = assignment.deadline - self.current_time
-            remaining_hours = time_diff.total_seconds() / 3600
+        return dict(self._workload_distribution)
 
-            if remaining_hours < 0:
-                distribution["overdue"] += assignment.estimated_hours
-            elif remaining_hours <= 24:
-                distribution["today"] += assignment.estimated_hours
-            elif remaining_hours <= 7 * 24:
-                distribution["this_week"] += assignment.estimated_hours
-            else:
-                distribution["this_month"] += assignment.estimated_hours
+    @cached_property
+    def _workload_distribution(self) -> Dict[str, float]:
+        """Workload per time period, computed once per instance."""
+        incomplete = self._incomplete
+        totals = np.bincount(
+            self._deadline_buckets[incomplete], weights=self._hours[incomplete], minlength=4
+        )
 
-        return distribution
+        return {
+            "today": float(totals[1]),
+            "this_week": float(totals[2]),
+            "this_month": float(totals[3]),
+            "overdue": float(totals[0])
+        }
 
     def generate_recommendations(self) -> List[Dict[str, Any]]:
         """
@@ -134,13 +213,15 @@ class AssignmentInsights:
         Returns:
             List of recommendation dictionaries.
         """
+        return list(self._recommendations)
+
+    @cached_property
+    def _recommendations(self) -> List[Dict[str, Any]]:
+        """Recommendations, computed once per instance."""
         recommendations = []
 
         # Check for overdue assignments
-        overdue_assignments = [
-            a for a in self.assignments
-            if not a.completed and a.deadline < self.current_time
-        ]
+        overdue_assignments = self._overdue_assignments
 
         if overdue_assignments:
             recommendations.append({
@@ -148,26 +229,27 @@ class AssignmentInsights:
                 "category": "overdue",
                 "message": f"You have {len(overdue_assignments)} overdue assignment(s). Prioritize completing them immediately.",
                 "affected_assignments": [a.id for a in overdue_assignments],
-                "priority": PriorityLevel.CRITICAL.value
+                "priority": PriorityLevel.CRITICAL.label
             })
 
         # Analyze heavy workload periods
-        workload = self.calculate_workload_distribution()
+        workload = self._workload_distribution
         if workload["today"] > 10:
             recommendations.append({
                 "type": "warning",
                 "category": "heavy_workload",
                 "message": f"You have {workload['today']:.1f} hours of work due today. Consider adjusting your schedule.",
                 "affected_period": "today",
-                "priority": PriorityLevel.HIGH.value
+                "priority": PriorityLevel.HIGH.label
             })
 
         # Check for unstarted high-priority assignments
-        unstarted_high_priority = [
-            a for a in self.assignments
-            if not a.completed and a.progress == 0
-            and a.priority in [PriorityLevel.CRITICAL, PriorityLevel.HIGH]
+        incomplete = self._incomplete
+        unstarted = incomplete[
+            (self._progress[incomplete] == 0)
+            & np.isin(self._priority_codes[incomplete], _HIGH_PRIORITY_CODES)
         ]
+        unstarted_high_priority = [self.assignments[i] for i in unstarted]
 
         if unstarted_high_priority:
             recommendations.append({
@@ -175,7 +257,7 @@ class AssignmentInsights:
                 "category": "start_urgent",
                 "message": f"Start {len(unstarted_high_priority)} high-priority assignment(s) that haven't been started.",
                 "affected_assignments": [a.id for a in unstarted_high_priority],
-                "priority": PriorityLevel.HIGH.value
+                "priority": PriorityLevel.HIGH.label
             })
 
         return recommendations
@@ -187,14 +269,52 @@ class AssignmentInsights:
         Returns:
             List of assignments sorted by priority.
         """
-        incomplete_assignments = [a for a in self.assignments if not a.completed]
+        return list(self._prioritized)
 
-        def priority_key(assignment: Assignment) -> tuple:
-            urgency = self.calculate_urgency_score(assignment)
-            difficulty_weight = self._difficulty_weight(assignment.difficulty)
-            return (-urgency, -difficulty_weight, assignment.deadline)
+    def top_k_priority(self, k: int = 5) -> List[Assignment]:
+        """
+        Get the k highest-priority incomplete assignments without sorting the rest.
 
-        return sorted(incomplete_assignments, key=priority_key)
+        Args:
+            k: Number of assignments to return.
+
+        Returns:
+            Up to k assignments in the same order as get_prioritized_assignment_order().
+        """
+        return [self.assignments[i] for i in self._top_k_positions(k)]
+
+    def _top_k_positions(self, k: int) -> np.ndarray:
+        """Positions of the k highest-priority incomplete assignments."""
+        incomplete = self._incomplete
+        if k <= 0:
+            return incomplete[:0]
+        if "_priority_order" in self.__dict__ or k >= incomplete.size:
+            return self._priority_order[:k]
+
+        # Partition on urgency, keeping every tie with the k-th best so the
+        # difficulty/deadline tie-breaks match the full order exactly
+        neg_urgency = -self._urgency[incomplete]
+        threshold = np.partition(neg_urgency, k - 1)[k - 1]
+        return self._sort_by_priority(incomplete[neg_urgency <= threshold])[:k]
+
+    def _sort_by_priority(self, positions: np.ndarray) -> np.ndarray:
+        """Sort positions by urgency, then difficulty, then deadline."""
+        urgency = self._urgency[positions]
+        difficulty_weights = _DIFFICULTY_WEIGHT_ARRAY[self._difficulty_codes[positions]]
+
+        # lexsort treats the last key as primary
+        order = np.lexsort((self._deadlines[positions], -difficulty_weights, -urgency))
+        return positions[order]
+
+    @cached_property
+    def _priority_order(self) -> np.ndarray:
+        """Positions of incomplete assignments in priority order."""
+        return self._sort_by_priority(self._incomplete)
+
+    @cached_property
+    def _prioritized(self) -> List[Assignment]:
+        """Incomplete assignments in priority order, computed once per instance."""
+        return [self.assignments[i] for i in self._priority_order]
 
     def estimate_completion_time(self) -> Optional[datetime]:
         """
@@ -203,9 +323,9 @@ class AssignmentInsights:
         Returns:
             Estimated completion datetime or None if impossible.
         """
-        prioritized = self.get_prioritized_assignment_order()
+        incomplete = self._incomplete
         current_time = self.current_time
-        total_hours = sum(a.estimated_hours for a in prioritized)
+        total_hours = float(self._hours[incomplete].sum())
 
         if total_hours == 0:
             return current_time
@@ -214,10 +334,9 @@ class AssignmentInsights:
         days_needed = total_hours / 8
         estimated_completion = current_time + timedelta(days=days_needed)
 
-        # Check if deadline violations exist
-        for assignment in prioritized:
-            if assignment.deadline < estimated_completion:
-                return None
+        # Ordering doesn't matter here: any deadline before the estimate is a violation
+        if self._deadlines[incomplete].min() < np.datetime64(estimated_completion, 'us'):
+            return None
 
         return estimated_completion
 
@@ -226,21 +345,23 @@ class AssignmentInsights:
         Generate comprehensive daily insights.
 
         Returns:
-            Dictionary containing daily insights.
+            Dictionary containing daily insights; timestamps are datetime objects.
         """
         workload = self.calculate_workload_distribution()
         recommendations = self.generate_recommendations()
-        prioritized = self.get_prioritized_assignment_order()
+        top_priorities = [
+            (self.assignments[i], float(self._urgency[i])) for i in self._top_k_positions(5)
+        ]
 
         completion_estimate = self.estimate_completion_time()
 
         return {
-            "generated_at": self.current_time.isoformat(),
+            "generated_at": self.current_time,
             "summary": {
                 "total_assignments": len(self.assignments),
-                "completed": sum(1 for a in self.assignments if a.completed),
-                "pending": sum(1 for a in self.assignments if not a.completed),
-                "overdue": len([a for a in self.assignments if not a.completed and a.deadline < self.current_time])
+                "completed": self._completed_count,
+                "pending": self._incomplete.size,
+                "overdue": len(self._overdue_assignments)
             },
             "workload": workload,
             "next_deadline": self._get_next_deadline(),
@@ -248,43 +369,49 @@ class AssignmentInsights:
                 {
                     "id": a.id,
                     "title": a.title,
-                    "deadline": a.deadline.isoformat(),
-                    "urgency_score": self.calculate_urgency_score(a),
+                    "deadline": a.deadline,
+                    "urgency_score": urgency,
                     "estimated_hours": a.estimated_hours
                 }
-                for a in prioritized[:5]
+                for a, urgency in top_priorities
             ],
             "recommendations": recommendations,
-            "estimated_completion": completion_estimate.isoformat() if completion_estimate else None
+            "estimated_completion": completion_estimate
         }
 
+    @cached_property
+    def _deadline_buckets(self) -> np.ndarray:
+        """Deadline bucket per assignment: 0 = overdue, 1 = today, 2 = this week, 3 = this month."""
+        buckets = np.digitize(self._hours_remaining, [24, 7 * 24], right=True) + 1
+        buckets[self._hours_remaining < 0] = 0
+        return buckets
+
+    @cached_property
+    def _overdue_assignments(self) -> List[Assignment]:
+        """Incomplete assignments whose deadline has passed."""
+        overdue = self._incomplete[self._deadline_buckets[self._incomplete] == 0]
+        return [self.assignments[i] for i in overdue]
+
     def _priority_weight(self, priority: PriorityLevel) -> float:
         """Get urgency weight for priority level."""
-        weights = {
-            PriorityLevel.CRITICAL: 30.0,
-            PriorityLevel.HIGH: 20.0,
-            PriorityLevel.MEDIUM: 10.0,
-            PriorityLevel.LOW: 0.0
-        }
-        return weights.get(priority, 0.0)
+        return _PRIORITY_WEIGHTS[priority]
 
     def _difficulty_weight(self, difficulty: DifficultyLevel) -> float:
         """Get weight for difficulty level."""
-        weights = {
-            DifficultyLevel.BEGINNER: 1.0,
-            DifficultyLevel.INTERMEDIATE: 2.0,
-            DifficultyLevel.ADVANCED: 3.0,
-            DifficultyLevel.EXPERT: 4.0
-        }
-        return weights.get(difficulty, 2.0)
+        return _DIFFICULTY_WEIGHTS[difficulty]
 
-    def _get_next_deadline(self) -> Optional[str]:
+    def _get_next_deadline(self) -> Optional[datetime]:
         """Get the next upcoming deadline."""
-        incomplete = [a for a in self.assignments if not a.completed and a.deadline >= self.current_time]
-        if not incomplete:
+        return self._next_deadline
+
+    @cached_property
+    def _next_deadline(self) -> Optional[datetime]:
+        """Earliest deadline among incomplete, not yet overdue assignments."""
+        upcoming = self._incomplete[self._deadline_buckets[self._incomplete] != 0]
+        if upcoming.size == 0:
             return None
-        next_assignment = min(incomplete, key=lambda a: a.deadline)
-        return next_assignment.deadline.isoformat()
+        next_assignment = self.assignments[upcoming[np.argmin(self._deadlines[upcoming])]]
+        return next_assignment.deadline
 
 
 class InsightAnalyzer:
@@ -305,7 +432,7 @@ class InsightAnalyzer:
 
         return {
             "report_type": "performance",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "insights": daily_insights,
             "suggestions": _get_personalized_suggestions(insights)
         }
@@ -324,8 +451,8 @@ class InsightAnalyzer:
         """
         try:
             daily_insights = insights.generate_daily_insights()
-            with open(filepath, 'w') as f:
-                json.dump(daily_insights, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(daily_insights, option=orjson.OPT_INDENT_2))
             return True
         except Exception as e:
             print(f"Error exporting insights: {e}")
@@ -344,7 +471,7 @@ def _get_personalized_suggestions(insights: AssignmentInsights) -> List[str]:
     if workload["today"] > 8:
         suggestions.append("Break down today's tasks into smaller chunks to stay motivated.")
 
-    if len(insights.get_prioritized_assignment_order()) > 5:
+    if insights._incomplete.size > 5:
         suggestions.append("Consider focusing on your top 3 priorities to avoid feeling overwhelmed.")
 
     if insights.estimate_completion_time() is None:
@@ -400,4 +527,4 @@ if __name__ == "__main__":
     insights = AssignmentInsights(sample_assignments)
 
     daily_insights = insights.generate_daily_insights()
-    print(json.dumps(daily_insights, indent=2))
+    print(orjson.dumps(daily_insights, option=orjson.OPT_INDENT_2).decode())
@@ -6,24 +6,60 @@ Author: Angad05-hub
 Created: 2025-12-24
 """
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
 from dotenv import load_dotenv
 import os
+import atexit
 import logging
+import queue
+import orjson
+import ciso8601
 from datetime import datetime
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 
 # Load environment variables
 load_dotenv()
 
+# Imported after load_dotenv() so settings from .env are picked up
+from config import DB_POOL_SIZE, DB_MAX_OVERFLOW  # noqa: E402
+from database import set_sqlite_pragmas  # noqa: E402
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which encodes datetimes natively"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///deadlineai.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_pre_ping': True}
+
+# In-memory SQLite runs on a single static connection, which takes no pool sizing
+if app.config['SQLALCHEMY_DATABASE_URI'] not in ('sqlite://', 'sqlite:///:memory:'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW
+    )
 
 # Initialize extensions
 db = SQLAlchemy(app)
@@ -32,11 +68,23 @@ login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+# Same SQLite pragmas as database.py, registered on this app's engine only
+if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    with app.app_context():
+        event.listen(db.engine, 'connect', set_sqlite_pragmas)
+
+# Configure logging: callers only enqueue records, and a background listener
+# does the actual writing so request and scheduler threads never block on I/O
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
 
@@ -90,6 +138,17 @@ class Task(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = db.Column(db.DateTime)
     
+    # ISO-8601 copies of the timestamps, kept in sync on write so reads skip isoformat()
+    deadline_iso = db.Column(db.String(32))
+    created_at_iso = db.Column(db.String(32))
+    updated_at_iso = db.Column(db.String(32))
+    
+    # Composite indexes backing the per-user task listing filters
+    __table_args__ = (
+        db.Index('ix_task_assigned_status_prio', 'assigned_to', 'status', 'priority'),
+        db.Index('ix_task_created_status_prio', 'created_by', 'status', 'priority'),
+    )
+    
     def __repr__(self):
         return f'<Task {self.title}>'
     
@@ -98,7 +157,7 @@ class Task(db.Model):
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'deadline': self.deadline.isoformat(),
+            'deadline': self.deadline_iso or _iso(self.deadline),
             'priority': self.priority,
             'status': self.status,
             'assigned_to': self.assigned_to,
@@ -106,12 +165,79 @@ class Task(db.Model):
             'category': self.category,
             'tags': self.tags,
             'estimated_hours': self.estimated_hours,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+            'created_at': self.created_at_iso or _iso(self.created_at),
+            'updated_at': self.updated_at_iso or _iso(self.updated_at),
+            'completed_at': self.completed_at
         }
 
 
+def _iso(value):
+    """ISO string for a DateTime column value as stored (the column keeps no UTC offset)"""
+    if value is None:
+        return None
+    return value.replace(tzinfo=None).isoformat()
+
+
+def _refresh_task_iso(task):
+    task.deadline_iso = _iso(task.deadline)
+    task.created_at_iso = _iso(task.created_at)
+    task.updated_at_iso = _iso(task.updated_at)
+
+
+def upgrade_task_iso_columns():
+    """Add the ISO timestamp columns to an existing task table and backfill them"""
+    table = Task.__table__
+    existing = {column['name'] for column in db.inspect(db.engine).get_columns(table.name)}
+    for name in ('deadline_iso', 'created_at_iso', 'updated_at_iso'):
+        if name in existing:
+            continue
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(db.text(f'ALTER TABLE {table.name} ADD COLUMN {name} VARCHAR(32)'))
+            logger.info(f'Added column {table.name}.{name}')
+        except DBAPIError:
+            # Another worker added it first
+            pass
+    
+    rows = db.session.execute(
+        db.select(Task.id, Task.deadline, Task.created_at, Task.updated_at).where(db.or_(
+            Task.deadline_iso.is_(None),
+            Task.created_at_iso.is_(None),
+            Task.updated_at_iso.is_(None)
+        ))
+    ).all()
+    if rows:
+        # updated_at is passed through unchanged so its onupdate default doesn't fire
+        db.session.execute(db.update(Task), [{
+            'id': r.id,
+            'updated_at': r.updated_at,
+            'deadline_iso': _iso(r.deadline),
+            'created_at_iso': _iso(r.created_at),
+            'updated_at_iso': _iso(r.updated_at)
+        } for r in rows])
+        db.session.commit()
+        logger.info(f'Backfilled ISO timestamps for {len(rows)} tasks')
+
+
+@event.listens_for(Task, 'before_insert')
+def set_task_iso_on_insert(mapper, connection, target):
+    """Fill in timestamps and their ISO strings for a new task"""
+    now = datetime.utcnow()
+    if target.created_at is None:
+        target.created_at = now
+    if target.updated_at is None:
+        target.updated_at = now
+    _refresh_task_iso(target)
+
+
+@event.listens_for(Task, 'before_update')
+def set_task_iso_on_update(mapper, connection, target):
+    """Bump updated_at and refresh the ISO strings for a modified task"""
+    if not db.inspect(target).attrs.updated_at.history.has_changes():
+        target.updated_at = datetime.utcnow()
+    _refresh_task_iso(target)
+
+
 class Notification(db.Model):
     """Notification model for user alerts"""
     id = db.Column(db.Integer, primary_key=True)
@@ -127,6 +253,12 @@ class Notification(db.Model):
     
     def __repr__(self):
         return f'<Notification {self.id}>'
+    
+    @classmethod
+    def bulk_create(cls, items):
+        """Insert many notifications from dicts (user_id, task_id, message, ...) in one batch"""
+        db.session.bulk_insert_mappings(cls, items)
+        db.session.commit()
 
 
 # ==================== Login Manager ====================
@@ -136,6 +268,14 @@ def load_user(user_id):
     return User.query.get(int(user_id))
 
 
+# ==================== Request Hooks ====================
+
+@app.before_request
+def set_request_time():
+    """Capture the wall-clock time once per request"""
+    g.now = datetime.utcnow()
+
+
 # ==================== Routes - Authentication ====================
 
 @app.route('/api/health', methods=['GET'])
@@ -143,7 +283,7 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': g.now,
         'service': 'Deadline Assign AI'
     }), 200
 
@@ -248,17 +388,46 @@ def get_tasks():
         status = request.args.get('status')
         priority = request.args.get('priority')
         
-        query = Task.query.filter(
-            (Task.assigned_to == current_user.id) | (Task.created_by == current_user.id)
-        )
-        
+        filters = []
         if status:
-            query = query.filter_by(status=status)
+            filters.append(Task.status == status)
         if priority:
-            query = query.filter_by(priority=priority)
+            filters.append(Task.priority == priority)
         
-        tasks = query.all()
-        return jsonify([task.to_dict() for task in tasks]), 200
+        # Select plain columns instead of Task instances to skip ORM object construction
+        columns = (
+            Task.id, Task.title, Task.description, Task.deadline_iso, Task.priority,
+            Task.status, Task.assigned_to, Task.created_by, Task.category, Task.tags,
+            Task.estimated_hours, Task.created_at_iso, Task.updated_at_iso, Task.completed_at
+        )
+        
+        # UNION ALL of the assigned/created branches lets each one use its own
+        # composite index; the second branch skips rows already in the first.
+        assigned = db.select(*columns).where(Task.assigned_to == current_user.id, *filters)
+        created = db.select(*columns).where(
+            Task.created_by == current_user.id,
+            db.or_(Task.assigned_to.is_(None), Task.assigned_to != current_user.id),
+            *filters
+        )
+        query = db.union_all(assigned, created)
+        
+        rows = db.session.execute(query).all()
+        return jsonify([{
+            'id': r.id,
+            'title': r.title,
+            'description': r.description,
+            'deadline': r.deadline_iso,
+            'priority': r.priority,
+            'status': r.status,
+            'assigned_to': r.assigned_to,
+            'created_by': r.created_by,
+            'category': r.category,
+            'tags': r.tags,
+            'estimated_hours': r.estimated_hours,
+            'created_at': r.created_at_iso,
+            'updated_at': r.updated_at_iso,
+            'completed_at': r.completed_at
+        } for r in rows]), 200
     except Exception as e:
         logger.error(f'Error fetching tasks: {str(e)}')
         return jsonify({'error': 'Failed to fetch tasks'}), 500
@@ -278,7 +447,7 @@ def create_task():
         task = Task(
             title=data.get('title'),
             description=data.get('description', ''),
-            deadline=datetime.fromisoformat(data.get('deadline')),
+            deadline=ciso8601.parse_datetime(data.get('deadline')),
             priority=data.get('priority', 'medium'),
             category=data.get('category'),
             tags=data.get('tags', ''),
@@ -297,34 +466,30 @@ def create_task():
         return jsonify({'error': 'Failed to create task'}), 500
 
 
+def _owned_task(task_id, user_id, creator_only=False):
+    """Fetch a task the user may access (or, with creator_only, created) or abort with 404"""
+    query = Task.query.filter(Task.id == task_id)
+    if creator_only:
+        query = query.filter(Task.created_by == user_id)
+    else:
+        query = query.filter(db.or_(Task.assigned_to == user_id, Task.created_by == user_id))
+    return query.first_or_404()
+
+
 @app.route('/api/tasks/<int:task_id>', methods=['GET'])
 @login_required
 def get_task(task_id):
     """Get a specific task"""
-    try:
-        task = Task.query.get_or_404(task_id)
-        
-        # Check authorization
-        if task.assigned_to != current_user.id and task.created_by != current_user.id:
-            return jsonify({'error': 'Unauthorized'}), 403
-        
-        return jsonify(task.to_dict()), 200
-    except Exception as e:
-        logger.error(f'Error fetching task {task_id}: {str(e)}')
-        return jsonify({'error': 'Task not found'}), 404
+    task = _owned_task(task_id, current_user.id)
+    return jsonify(task.to_dict()), 200
 
 
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 @login_required
 def update_task(task_id):
     """Update a task"""
+    task = _owned_task(task_id, current_user.id, creator_only=True)
     try:
-        task = Task.query.get_or_404(task_id)
-        
-        # Check authorization
-        if task.created_by != current_user.id:
-            return jsonify({'error': 'Unauthorized'}), 403
-        
         data = request.get_json()
         
         if 'title' in data:
@@ -332,7 +497,7 @@ def update_task(task_id):
         if 'description' in data:
             task.description = data['description']
         if 'deadline' in data:
-            task.deadline = datetime.fromisoformat(data['deadline'])
+            task.deadline = ciso8601.parse_datetime(data['deadline'])
         if 'priority' in data:
             task.priority = data['priority']
         if 'status' in data:
@@ -340,7 +505,7 @@ def update_task(task_id):
         if 'assigned_to' in data:
             task.assigned_to = data['assigned_to']
         
-        task.updated_at = datetime.utcnow()
+        task.updated_at = g.now
         db.session.commit()
         logger.info(f'Task updated: {task_id}')
         return jsonify(task.to_dict()), 200
@@ -354,13 +519,8 @@ def update_task(task_id):
 @login_required
 def delete_task(task_id):
     """Delete a task"""
+    task = _owned_task(task_id, current_user.id, creator_only=True)
     try:
-        task = Task.query.get_or_404(task_id)
-        
-        # Check authorization
-        if task.created_by != current_user.id:
-            return jsonify({'error': 'Unauthorized'}), 403
-        
         db.session.delete(task)
         db.session.commit()
         logger.info(f'Task deleted: {task_id}')
@@ -387,7 +547,7 @@ def get_notifications():
             'message': n.message,
             'type': n.notification_type,
             'is_read': n.is_read,
-            'created_at': n.created_at.isoformat()
+            'created_at': n.created_at
         } for n in notifications]), 200
     except Exception as e:
         logger.error(f'Error fetching notifications: {str(e)}')
@@ -398,12 +558,10 @@ def get_notifications():
 @login_required
 def mark_notification_read(notification_id):
     """Mark notification as read"""
+    notification = Notification.query.filter_by(
+        id=notification_id, user_id=current_user.id
+    ).first_or_404()
     try:
-        notification = Notification.query.get_or_404(notification_id)
-        
-        if notification.user_id != current_user.id:
-            return jsonify({'error': 'Unauthorized'}), 403
-        
         notification.is_read = True
         db.session.commit()
         return jsonify({'message': 'Notification marked as read'}), 200
@@ -441,6 +599,7 @@ def forbidden(error):
 def create_tables():
     """Create database tables"""
     db.create_all()
+    upgrade_task_iso_columns()
     logger.info('Database tables created')
 
 
@@ -450,6 +609,7 @@ if __name__ == '__main__':
     # Create tables
     with app.app_context():
         db.create_all()
+        upgrade_task_iso_columns()
     
     # Run development server
     debug_mode = os.getenv('FLASK_DEBUG', False)
@@ -4,6 +4,7 @@ Last updated: 2025-12-24 14:15:16 (UTC)
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Base directory of the application
@@ -60,6 +61,13 @@ SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
 SMTP_USERNAME = os.getenv('SMTP_USERNAME', '')
 SMTP_PASSWORD = os.getenv('SMTP_PASSWORD', '')
 SENDER_EMAIL = os.getenv('SENDER_EMAIL', 'noreply@deadlineai.com')
+SMTP_POOL_SIZE = int(os.getenv('SMTP_POOL_SIZE', 4))
+
+# Push notification configuration
+PUSH_SERVICE_URL = os.getenv('PUSH_SERVICE_URL', '')
+
+# Reminder dispatch
+REMINDER_WORKERS = int(os.getenv('REMINDER_WORKERS', 16))
 
 # Pagination
 ITEMS_PER_PAGE = int(os.getenv('ITEMS_PER_PAGE', 20))
@@ -89,8 +97,9 @@ DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
 RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
 RATE_LIMIT_REQUESTS_PER_MINUTE = int(os.getenv('RATE_LIMIT_REQUESTS_PER_MINUTE', 60))
 
+@lru_cache(maxsize=1)
 def get_config():
-    """Return the current configuration dictionary."""
+    """Return the current configuration dictionary (built once; callers must not mutate it)."""
     return {
         'debug': DEBUG,
         'environment': ENVIRONMENT,
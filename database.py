@@ -3,20 +3,50 @@ Database module for DEADLINEAI
 Handles database models and initialization
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Boolean, Float
+from sqlalchemy import create_engine, event, insert, Column, Integer, String, DateTime, Text, Boolean, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from datetime import datetime
 import os
 
+from config import DB_POOL_SIZE, DB_MAX_OVERFLOW
+
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///deadlineai.db")
 
+# Engine options: a sized, health-checked pool for server databases; SQLite
+# only needs cross-thread access (and a single shared in-memory connection)
+if "sqlite" in DATABASE_URL:
+    engine_options = {"connect_args": {"check_same_thread": False}}
+    if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+        engine_options["poolclass"] = StaticPool
+else:
+    engine_options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+engine = create_engine(DATABASE_URL, **engine_options)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL mode, lighter syncing and larger caches on new SQLite connections"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+if "sqlite" in DATABASE_URL:
+    event.listen(engine, "connect", set_sqlite_pragmas)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -42,9 +72,14 @@ class User(Base):
 class Task(Base):
     """Task model for storing project tasks"""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # A user's tasks by deadline / by status; user_id lookups use the leading column
+        Index("ix_tasks_user_deadline", "user_id", "deadline"),
+        Index("ix_tasks_user_status", "user_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, index=True, nullable=False)
+    user_id = Column(Integer, nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     deadline = Column(DateTime, nullable=False, index=True)
@@ -73,9 +108,13 @@ class Project(Base):
 class Notification(Base):
     """Notification model for storing user notifications"""
     __tablename__ = "notifications"
+    __table_args__ = (
+        # A user's (unread) notifications, newest first
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, index=True, nullable=False)
+    user_id = Column(Integer, nullable=False)
     task_id = Column(Integer, index=True, nullable=True)
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
@@ -84,6 +123,13 @@ class Notification(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+def bulk_insert(db, model, rows, batch_size=1000):
+    """Insert many rows (dicts of column values) in executemany batches of batch_size"""
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(model), rows[start:start + batch_size])
+        db.commit()
+
+
 def init_db():
     """Initialize the database by creating all tables"""
     Base.metadata.create_all(bind=engine)
@@ -5,16 +5,40 @@ This module provides functionality for scheduling reminders and sending notifica
 for upcoming deadlines. It includes scheduling, notification delivery, and persistence.
 """
 
+import heapq
+import logging
+import os
+import queue
+import smtplib
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional
-from dataclasses import dataclass, asdict
-import json
+from email.message import EmailMessage
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass
 import uuid
 
+import orjson
+import requests
 
-@dataclass
+from config import (
+    PUSH_SERVICE_URL,
+    REMINDER_WORKERS,
+    SENDER_EMAIL,
+    SMTP_PASSWORD,
+    SMTP_POOL_SIZE,
+    SMTP_PORT,
+    SMTP_SERVER,
+    SMTP_USERNAME,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class Reminder:
     """Represents a reminder for a deadline."""
     
@@ -35,6 +59,23 @@ class Reminder:
         """Initialize default values for optional fields."""
         if self.metadata is None:
             self.metadata = {}
+    
+    def to_dict(self) -> Dict:
+        """Return the reminder's fields as a plain dict (datetimes left as objects)."""
+        return {
+            'id': self.id,
+            'deadline_id': self.deadline_id,
+            'title': self.title,
+            'description': self.description,
+            'deadline_time': self.deadline_time,
+            'reminder_time': self.reminder_time,
+            'notification_type': self.notification_type,
+            'status': self.status,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'recipient': self.recipient,
+            'metadata': self.metadata
+        }
 
 
 class ReminderScheduler:
@@ -50,11 +91,20 @@ class ReminderScheduler:
             notification_handler: Callable to handle notification dispatch
         """
         self.reminders: Dict[str, Reminder] = {}
+        # Min-heap of (reminder_time, reminder_id); entries for removed or
+        # no-longer-pending reminders are skipped lazily when they surface.
+        self._heap: List[Tuple[datetime, str]] = []
+        # IDs popped for dispatch whose outcome hasn't been recorded yet; they
+        # still read 'pending' and must not be scheduled again meanwhile
+        self._in_flight: Set[str] = set()
         self.notification_handler = notification_handler or self._default_handler
         self.scheduler_thread = None
         self.running = False
-        self.check_interval = 60  # Check every 60 seconds
         self._lock = threading.Lock()
+        # Signalled whenever reminders change so the scheduler can re-plan its wait
+        self._cv = threading.Condition(self._lock)
+        # Created by start() and shut down by stop()
+        self._pool: Optional[ThreadPoolExecutor] = None
     
     def add_reminder(
         self,
@@ -101,8 +151,10 @@ class ReminderScheduler:
             metadata=metadata or {}
         )
         
-        with self._lock:
+        with self._cv:
             self.reminders[reminder_id] = reminder
+            heapq.heappush(self._heap, (reminder_time, reminder_id))
+            self._cv.notify()
         
         return reminder
     
@@ -116,9 +168,12 @@ class ReminderScheduler:
         Returns:
             True if removed, False if not found
         """
-        with self._lock:
+        with self._cv:
             if reminder_id in self.reminders:
                 del self.reminders[reminder_id]
+                if len(self._heap) > 2 * len(self.reminders) + 64:
+                    self._compact_heap()
+                self._cv.notify()
                 return True
         return False
     
@@ -133,27 +188,54 @@ class ReminderScheduler:
         Returns:
             True if updated, False if not found
         """
-        with self._lock:
+        with self._cv:
             if reminder_id in self.reminders:
-                self.reminders[reminder_id].status = status
-                self.reminders[reminder_id].updated_at = datetime.utcnow()
+                reminder = self.reminders[reminder_id]
+                if status == 'pending' and reminder.status != 'pending':
+                    heapq.heappush(self._heap, (reminder.reminder_time, reminder_id))
+                reminder.status = status
+                reminder.updated_at = datetime.utcnow()
+                self._cv.notify()
                 return True
         return False
     
+    def restore_reminders(self, reminders: List[Reminder]):
+        """
+        Put previously saved reminders back into the scheduler.
+        
+        This is the restore path for ReminderPersistence.load_reminders(): it
+        registers each reminder and schedules the pending ones. Adding them to
+        self.reminders directly would leave them off the heap, so they would
+        never be sent.
+        
+        Args:
+            reminders: Reminder objects to restore (existing IDs are replaced)
+        """
+        with self._cv:
+            for reminder in reminders:
+                self.reminders[reminder.id] = reminder
+                if reminder.status == 'pending':
+                    heapq.heappush(self._heap, (reminder.reminder_time, reminder.id))
+            self._cv.notify()
+    
     def get_reminder(self, reminder_id: str) -> Optional[Reminder]:
         """Get a reminder by ID."""
         with self._lock:
             return self.reminders.get(reminder_id)
     
     def get_pending_reminders(self) -> List[Reminder]:
-        """Get all pending reminders."""
+        """Get all pending reminders that aren't currently being sent."""
         with self._lock:
-            return [r for r in self.reminders.values() if r.status == 'pending']
+            return [
+                r for r in self.reminders.values()
+                if r.status == 'pending' and r.id not in self._in_flight
+            ]
     
     def start(self):
         """Start the reminder scheduler in a background thread."""
         if not self.running:
             self.running = True
+            self._pool = self._create_pool()
             self.scheduler_thread = threading.Thread(
                 target=self._scheduler_loop,
                 daemon=True
@@ -162,33 +244,138 @@ class ReminderScheduler:
     
     def stop(self):
         """Stop the reminder scheduler."""
-        self.running = False
+        with self._cv:
+            self.running = False
+            self._cv.notify()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+    
+    @staticmethod
+    def _create_pool() -> ThreadPoolExecutor:
+        """Create the worker pool used to send notifications concurrently."""
+        return ThreadPoolExecutor(
+            max_workers=REMINDER_WORKERS,
+            thread_name_prefix='reminder-dispatch'
+        )
     
     def _scheduler_loop(self):
-        """Main scheduler loop that checks and dispatches reminders."""
+        """Main scheduler loop that dispatches reminders and sleeps until the next one is due."""
         while self.running:
             try:
                 self._check_and_dispatch_reminders()
-                time.sleep(self.check_interval)
+                with self._cv:
+                    if self.running:
+                        self._cv.wait(timeout=self._seconds_until_next_due())
             except Exception as e:
-                print(f"Error in scheduler loop: {e}")
+                logger.exception(f"Error in scheduler loop: {e}")
+    
+    def _seconds_until_next_due(self) -> Optional[float]:
+        """
+        Seconds until the earliest pending reminder is due (caller holds the lock).
+        
+        Returns:
+            Seconds to wait, or None if nothing is pending
+        """
+        while self._heap:
+            reminder_time, reminder_id = self._heap[0]
+            if self._is_pending(reminder_id):
+                return max(0.0, (reminder_time - datetime.utcnow()).total_seconds())
+            heapq.heappop(self._heap)
+        return None
+    
+    def _compact_heap(self):
+        """Rebuild the heap from pending reminders, dropping stale entries (caller holds the lock)."""
+        self._heap = [
+            (r.reminder_time, r.id) for r in self.reminders.values()
+            if r.status == 'pending' and r.id not in self._in_flight
+        ]
+        heapq.heapify(self._heap)
+    
+    def _is_pending(self, reminder_id: str) -> bool:
+        """Check whether a heap entry still refers to a pending, undispatched reminder (caller holds the lock)."""
+        reminder = self.reminders.get(reminder_id)
+        return (
+            reminder is not None
+            and reminder.status == 'pending'
+            and reminder_id not in self._in_flight
+        )
+    
+    def _pop_due_reminders(self, now: datetime) -> List[Reminder]:
+        """Pop pending reminders due at or before now off the heap (caller holds the lock)."""
+        due: Dict[str, Reminder] = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, reminder_id = heapq.heappop(self._heap)
+            if self._is_pending(reminder_id):
+                due[reminder_id] = self.reminders[reminder_id]
+        self._in_flight.update(due)
+        return list(due.values())
     
     def _check_and_dispatch_reminders(self):
         """Check for reminders that should be sent and dispatch them."""
         now = datetime.utcnow()
-        pending = self.get_pending_reminders()
+        # Popping marks the whole batch in flight before anything is submitted
+        with self._lock:
+            due = self._pop_due_reminders(now)
+        if not due:
+            return
         
-        for reminder in pending:
-            # Check if reminder time has passed
-            if reminder.reminder_time <= now:
-                try:
-                    self.notification_handler(reminder)
-                    self.update_reminder_status(reminder.id, 'sent')
-                except Exception as e:
-                    print(f"Failed to send reminder {reminder.id}: {e}")
-                    self.update_reminder_status(reminder.id, 'failed')
+        futures: List[Future] = []
+        for reminder in due:
+            try:
+                futures.append(self._pool.submit(self._dispatch_one, reminder))
+            except RuntimeError:
+                # The pool was shut down by stop(); reschedule whatever wasn't submitted
+                self._requeue(due[len(futures):])
+                break
+        if not futures:
+            return
+        
+        # Send concurrently without waiting here; the send that completes the
+        # batch records every outcome under one lock acquisition
+        outcomes: List[Tuple[Reminder, str]] = []
+        remaining = [len(futures)]
+        counter_lock = threading.Lock()
+        
+        def record(reminder: Reminder, future: Future):
+            outcomes.append((reminder, 'failed' if future.exception() else future.result()))
+            with counter_lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            self._apply_outcomes(outcomes)
+        
+        for reminder, future in zip(due, futures):
+            future.add_done_callback(partial(record, reminder))
+    
+    def _requeue(self, reminders: List[Reminder]):
+        """Put popped reminders that were never submitted back on the heap."""
+        with self._lock:
+            for reminder in reminders:
+                self._in_flight.discard(reminder.id)
+                heapq.heappush(self._heap, (reminder.reminder_time, reminder.id))
+    
+    def _apply_outcomes(self, outcomes: List[Tuple[Reminder, str]]):
+        """Record the statuses of a finished dispatch batch, skipping removed reminders."""
+        with self._lock:
+            updated_at = datetime.utcnow()
+            for reminder, status in outcomes:
+                self._in_flight.discard(reminder.id)
+                if self.reminders.get(reminder.id) is reminder:
+                    reminder.status = status
+                    reminder.updated_at = updated_at
+    
+    def _dispatch_one(self, reminder: Reminder) -> str:
+        """Send a single reminder and return its new status ('sent' or 'failed')."""
+        try:
+            # Handlers such as NotificationManager.send_notification report failure with False
+            if self.notification_handler(reminder) is False:
+                return 'failed'
+            return 'sent'
+        except Exception as e:
+            logger.exception(f"Failed to send reminder {reminder.id}: {e}")
+            return 'failed'
     
     @staticmethod
     def _default_handler(reminder: Reminder):
@@ -222,34 +409,43 @@ class ReminderPersistence:
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = f"{self.filepath}.tmp"
         try:
-            reminders_data = []
-            for reminder in scheduler.reminders.values():
-                data = asdict(reminder)
-                # Convert datetime objects to ISO format strings
-                data['deadline_time'] = reminder.deadline_time.isoformat()
-                data['reminder_time'] = reminder.reminder_time.isoformat()
-                data['created_at'] = reminder.created_at.isoformat()
-                data['updated_at'] = reminder.updated_at.isoformat()
-                reminders_data.append(data)
+            # Copy field values under the lock so concurrent status updates can't
+            # tear a record, then serialize and write without holding it
+            with scheduler._lock:
+                reminders_data = [r.to_dict() for r in scheduler.reminders.values()]
             
-            with open(self.filepath, 'w') as f:
-                json.dump(reminders_data, f, indent=2)
+            # orjson writes the datetimes as ISO strings natively; free-form
+            # metadata may have non-str keys, which are stringified as json.dump did
+            payload = orjson.dumps(reminders_data, option=orjson.OPT_NON_STR_KEYS)
+            
+            # Write to a temporary file, flush it to disk, then swap it in so a
+            # crash or power loss never leaves a partial or empty file
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
             return True
         except Exception as e:
-            print(f"Error saving reminders: {e}")
+            logger.exception(f"Error saving reminders: {e}")
+            with suppress(OSError):
+                os.remove(tmp_path)
             return False
     
     def load_reminders(self) -> List[Reminder]:
         """
         Load reminders from file.
         
+        Pass the result to ReminderScheduler.restore_reminders() to schedule them.
+        
         Returns:
             List of Reminder objects
         """
         try:
-            with open(self.filepath, 'r') as f:
-                reminders_data = json.load(f)
+            with open(self.filepath, 'rb') as f:
+                reminders_data = orjson.loads(f.read())
             
             reminders = []
             for data in reminders_data:
@@ -266,10 +462,121 @@ class ReminderPersistence:
         except FileNotFoundError:
             return []
         except Exception as e:
-            print(f"Error loading reminders: {e}")
+            logger.exception(f"Error loading reminders: {e}")
             return []
 
 
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of authenticated SMTP connections.
+    
+    Connections are opened on demand and returned to the pool after use, so
+    the TCP/TLS handshake and login are paid once per connection rather than
+    once per message.
+    """
+    
+    def __init__(self, host: str, port: int, username: str, password: str, max_idle: int = 4):
+        """
+        Initialize the connection pool.
+        
+        Args:
+            host: SMTP server hostname
+            port: SMTP server port (STARTTLS)
+            username: Login user name (empty to skip login)
+            password: Login password
+            max_idle: Maximum number of idle connections kept open
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max_idle)
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        conn = smtplib.SMTP(self.host, self.port, timeout=30)
+        try:
+            conn.starttls()
+            if self.username:
+                conn.login(self.username, self.password)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+    
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a connection from the pool.
+        
+        Connections are discarded instead of returned if anything raises during use.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        
+        try:
+            yield conn
+        except BaseException:
+            self._close(conn)
+            raise
+        else:
+            self._release(conn)
+    
+    def send_message(self, msg: EmailMessage):
+        """
+        Send a message on a pooled connection.
+        
+        An idle connection the server has since dropped is discarded and the
+        message is retried once on a new connection.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+        
+        if conn is not None:
+            try:
+                self._send(conn, msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                pass
+        self._send(self._connect(), msg)
+    
+    def _send(self, conn: smtplib.SMTP, msg: EmailMessage):
+        """Send msg on conn and return it to the pool, discarding it if anything raises."""
+        try:
+            conn.send_message(msg)
+        except BaseException:
+            self._close(conn)
+            raise
+        self._release(conn)
+    
+    def _release(self, conn: smtplib.SMTP):
+        """Return a healthy connection to the pool, closing it if the pool is full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._close(conn)
+    
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+    
+    @staticmethod
+    def _close(conn: smtplib.SMTP):
+        """Close a connection, ignoring errors from an already broken session."""
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+
+
 class NotificationManager:
     """
     Manages different notification channels.
@@ -283,6 +590,16 @@ class NotificationManager:
             'push': self._send_push,
             'in_app': self._send_in_app
         }
+        # Shared across dispatch threads so connections are reused between messages
+        self._smtp_pool = SMTPConnectionPool(
+            SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, max_idle=SMTP_POOL_SIZE
+        )
+        self._http_session = requests.Session()
+    
+    def close(self):
+        """Release pooled SMTP connections and the HTTP session."""
+        self._smtp_pool.close()
+        self._http_session.close()
     
     def send_notification(self, reminder: Reminder) -> bool:
         """
@@ -299,15 +616,24 @@ class NotificationManager:
             try:
                 return handler(reminder)
             except Exception as e:
-                print(f"Error sending {reminder.notification_type} notification: {e}")
+                logger.exception(f"Error sending {reminder.notification_type} notification: {e}")
                 return False
         return False
     
-    @staticmethod
-    def _send_email(reminder: Reminder) -> bool:
+    def _send_email(self, reminder: Reminder) -> bool:
         """Send email notification."""
         print(f"Sending email to {reminder.recipient}: {reminder.title}")
-        # TODO: Integrate with email service (SMTP, SendGrid, etc.)
+        if not SMTP_USERNAME:
+            # SMTP is not configured; console output only
+            return True
+        
+        msg = EmailMessage()
+        msg['From'] = SENDER_EMAIL
+        msg['To'] = reminder.recipient
+        msg['Subject'] = reminder.title
+        msg.set_content(f"{reminder.description}\n\nDeadline: {reminder.deadline_time}")
+        
+        self._smtp_pool.send_message(msg)
         return True
     
     @staticmethod
@@ -317,12 +643,24 @@ class NotificationManager:
         # TODO: Integrate with SMS service (Twilio, etc.)
         return True
     
-    @staticmethod
-    def _send_push(reminder: Reminder) -> bool:
+    def _send_push(self, reminder: Reminder) -> bool:
         """Send push notification."""
         print(f"Sending push notification to {reminder.recipient}: {reminder.title}")
-        # TODO: Integrate with push notification service (Firebase, etc.)
-        return True
+        if not PUSH_SERVICE_URL:
+            # Push service is not configured; console output only
+            return True
+        
+        response = self._http_session.post(
+            PUSH_SERVICE_URL,
+            json={
+                'recipient': reminder.recipient,
+                'title': reminder.title,
+                'body': reminder.description,
+                'deadline': reminder.deadline_time.isoformat()
+            },
+            timeout=10
+        )
+        return response.ok
     
     @staticmethod
     def _send_in_app(reminder: Reminder) -> bool:
@@ -370,4 +708,5 @@ if __name__ == "__main__":
             time.sleep(1)
     except KeyboardInterrupt:
         scheduler.stop()
+        notification_manager.close()
         print("Scheduler stopped")
@@ -5,10 +5,25 @@ This module provides helper functions for common operations used throughout
 the application, including date/time handling, formatting, and data validation.
 """
 
+from collections import ChainMap
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 import re
 
+# Patterns compiled once at import time
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+
+_DEFAULT_FMT = '%Y-%m-%d %H:%M:%S'
+_DEFAULT_SUFFIX = '...'
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
+
+def _format_default(dt: datetime) -> str:
+    """Render dt as 'YYYY-MM-DD HH:MM:SS' without going through strftime."""
+    return (f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} '
+            f'{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}')
+
 
 def get_current_utc_time() -> str:
     """
@@ -17,10 +32,10 @@ def get_current_utc_time() -> str:
     Returns:
         str: Current UTC time in 'YYYY-MM-DD HH:MM:SS' format
     """
-    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    return _format_default(datetime.now(timezone.utc))
 
 
-def format_datetime(dt: datetime, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+def format_datetime(dt: datetime, fmt: str = _DEFAULT_FMT) -> str:
     """
     Format a datetime object to a string.
     
@@ -31,10 +46,12 @@ def format_datetime(dt: datetime, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
     Returns:
         str: Formatted datetime string
     """
+    if fmt == _DEFAULT_FMT and isinstance(dt, datetime):
+        return _format_default(dt)
     return dt.strftime(fmt)
 
 
-def parse_datetime(date_string: str, fmt: str = '%Y-%m-%d %H:%M:%S') -> Optional[datetime]:
+def parse_datetime(date_string: str, fmt: str = _DEFAULT_FMT) -> Optional[datetime]:
     """
     Parse a datetime string to a datetime object.
     
@@ -61,11 +78,24 @@ def validate_email(email: str) -> bool:
     Returns:
         bool: True if email format is valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
-def truncate_string(text: str, max_length: int = 100, suffix: str = '...') -> str:
+def validate_emails_bulk(emails: List[str]) -> List[bool]:
+    """
+    Validate a batch of email addresses (e.g. from a CSV import).
+    
+    Args:
+        emails (List[str]): The email addresses to validate
+    
+    Returns:
+        List[bool]: One flag per input, True where the format is valid
+    """
+    match = _EMAIL_RE.match
+    return [match(email) is not None for email in emails]
+
+
+def truncate_string(text: str, max_length: int = 100, suffix: str = _DEFAULT_SUFFIX) -> str:
     """
     Truncate a string to a maximum length.
     
@@ -79,7 +109,24 @@ def truncate_string(text: str, max_length: int = 100, suffix: str = '...') -> st
     """
     if len(text) <= max_length:
         return text
-    return text[:max_length - len(suffix)] + suffix
+    suffix_len = _DEFAULT_SUFFIX_LEN if suffix is _DEFAULT_SUFFIX else len(suffix)
+    return text[:max_length - suffix_len] + suffix
+
+
+def truncate_strings_bulk(texts: List[str], max_length: int = 100, suffix: str = _DEFAULT_SUFFIX) -> List[str]:
+    """
+    Truncate many strings to a maximum length (e.g. when rendering a task list).
+    
+    Args:
+        texts (List[str]): The texts to truncate
+        max_length (int): Maximum length of each result (default: 100)
+        suffix (str): Suffix to add if truncated (default: '...')
+    
+    Returns:
+        List[str]: Truncated strings, in input order
+    """
+    cut = max_length - len(suffix)
+    return [text if len(text) <= max_length else text[:cut] + suffix for text in texts]
 
 
 def remove_duplicates(items: List[Any]) -> List[Any]:
@@ -87,18 +134,16 @@ def remove_duplicates(items: List[Any]) -> List[Any]:
     Remove duplicates from a list while preserving order.
     
     Args:
-        items (List[Any]): List that may contain duplicates
+        items (List[Any]): List of hashable items that may contain duplicates
     
     Returns:
         List[Any]: List with duplicates removed
+    
+    Raises:
+        TypeError: If an item is unhashable
     """
-    seen = set()
-    result = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dicts preserve insertion order, so this keeps the first occurrence of each item
+    return list(dict.fromkeys(items))
 
 
 def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
@@ -113,10 +158,26 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     """
     result = {}
     for d in dicts:
-        result.update(d)
+        result |= d
     return result
 
 
+def merge_dicts_view(*dicts: Dict[str, Any]) -> ChainMap:
+    """
+    Get a merged view of multiple dictionaries without copying them.
+    
+    Intended for read-only access; later dictionaries take precedence,
+    matching merge_dicts.
+    
+    Args:
+        *dicts: Variable number of dictionaries to merge
+    
+    Returns:
+        ChainMap: View over the dictionaries; changes to them are reflected
+    """
+    return ChainMap(*reversed(dicts))
+
+
 def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
     """
     Safely get a value from a dictionary with a default fallback.
@@ -142,8 +203,7 @@ def is_valid_url(url: str) -> bool:
     Returns:
         bool: True if URL format is valid, False otherwise
     """
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return re.match(pattern, url) is not None
+    return _URL_RE.match(url) is not None
 
 
 if __name__ == '__main__':
@@ -0,0 +1,12 @@
+"""
+WSGI entrypoint for DEADLINEAI
+
+Run in production with gevent workers, e.g.:
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+"""
+
+# Patch blocking I/O before the app (and its database drivers) are imported
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402